@@ -3,10 +3,33 @@ import importlib.util
 import os
 import threading
 from types import ModuleType
-from typing import Any
+from typing import Any, Dict, Tuple
 
 from exceptions.config import ImproperlyConfigured
 
+# Executed settings files keyed by (path, st_mtime_ns), so reload() only
+# re-runs a file that actually changed on disk.
+_SETTINGS_CACHE: Dict[Tuple[str, int], ModuleType] = {}
+
+
+def _load_settings_file(name: str, path: str, mtime_ns: int) -> ModuleType:
+    key = (path, mtime_ns)
+    module = _SETTINGS_CACHE.get(key)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        for stale in [k for k in _SETTINGS_CACHE if k[0] == path]:
+            del _SETTINGS_CACHE[stale]
+        _SETTINGS_CACHE[key] = module
+    return module
+
+
+def _copy_module(module: ModuleType) -> ModuleType:
+    copy = ModuleType(module.__name__, module.__doc__)
+    copy.__dict__.update(module.__dict__)
+    return copy
+
 class LazySettings:
 
     _wrapped: ModuleType | None = None
@@ -32,9 +55,15 @@ class LazySettings:
         """Reload settings module (useful for development)."""
         with self._lock:
             self._wrapped = None
+            self._clear_resolved()
             self._setup(force=True)
 
     # ---- Internals ----
+    def _clear_resolved(self):
+        """Drop setting values promoted into the instance dict by __getattr__."""
+        for key in [key for key in self.__dict__ if key.isupper()]:
+            del self.__dict__[key]
+
     def _setup(self, force=False):
         """Load the actual settings module."""
         if self._wrapped is not None and not force:
@@ -47,26 +76,31 @@ class LazySettings:
             or "./settings.py"
         )
 
-        if not os.path.exists(settings_path):
+        try:
+            mtime_ns = os.stat(settings_path).st_mtime_ns
+        except FileNotFoundError:
             raise ImproperlyConfigured(
                 f"Cannot find settings file: {settings_path!r}. "
                 f"Set BERMOID_SETTINGS_MODULE or pass path explicitly."
             )
 
-        spec = importlib.util.spec_from_file_location("bermoid_user_settings", settings_path)
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
+        module = _load_settings_file("bermoid_user_settings", settings_path, mtime_ns)
 
         env = getattr(module, "ENVIRONMENT", None)
         if env:
             env_path = os.path.join(os.path.dirname(settings_path), f"{env}.py")
-            if os.path.exists(env_path):
-                env_spec = importlib.util.spec_from_file_location(f"bermoid_{env}_settings", env_path)
-                env_module = importlib.util.module_from_spec(env_spec)
-                env_spec.loader.exec_module(env_module)
-                for key in dir(env_module):
-                    if key.isupper():
-                        setattr(module, key, getattr(env_module, key))
+            try:
+                env_mtime_ns = os.stat(env_path).st_mtime_ns
+            except FileNotFoundError:
+                env_mtime_ns = None
+            if env_mtime_ns is not None:
+                env_module = _load_settings_file(f"bermoid_{env}_settings", env_path, env_mtime_ns)
+                # Never write overrides into the cached base module.
+                module = _copy_module(module)
+                module.__dict__.update(
+                    (key, value) for key, value in vars(env_module).items()
+                    if key.isupper() and not key.startswith("_")
+                )
 
         self._wrapped = module
 
@@ -76,10 +110,16 @@ class LazySettings:
             self._setup()
 
         try:
-            return getattr(self._wrapped, name)
+            value = getattr(self._wrapped, name)
         except AttributeError:
             raise ImproperlyConfigured(f"Missing setting: '{name}' in your settings module.")
 
+        # Promote resolved settings onto the instance so later reads are
+        # plain attribute hits and never reach __getattr__ again.
+        if name.isupper():
+            self.__dict__[name] = value
+        return value
+
     def __setattr__(self, name, value):
         # Allow normal attributes to be set before configuration
         if name in {"_wrapped", "_lock", "_explicit_settings_path", "default_settings_path"}:
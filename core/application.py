@@ -8,7 +8,7 @@ import traceback
 import xml.etree.ElementTree as ET
 
 from enum import Enum
-from functools import wraps
+from functools import lru_cache, wraps
 from inspect import signature
 from collections import defaultdict
 
@@ -24,7 +24,8 @@ from typing import (
     Awaitable,
     Pattern,
     Union,
-    Mapping
+    Mapping,
+    FrozenSet,
 )
 
 from _types import Scope, Receive, Send, Lifespan, StatefulLifespan, ASGIApp
@@ -50,6 +51,12 @@ from exceptions.http.handler import handle_exception
 
 T = TypeVar("T")
 
+
+@lru_cache(maxsize=256)
+def _allow_header(methods: FrozenSet[str]) -> str:
+    return ", ".join(sorted(methods))
+
+
 class RequestStage(Enum):
     BEFORE: str = 'before'
     AFTER: str = 'after'
@@ -181,7 +188,7 @@ class Bermoid:
             self.routes.append(
                 (
                     converted_path,
-                    methods,
+                    frozenset(m.upper() for m in methods),
                     handler,
                     path_regex,
                     response_model,
@@ -287,7 +294,7 @@ class Bermoid:
             path, methods, handler, strict_slashes, response_model, endpoint = route
             route_tuple = (
                 path,
-                tuple(methods),
+                frozenset(methods),
                 handler,
                 strict_slashes,
                 response_model,
@@ -331,7 +338,7 @@ class Bermoid:
             ) in self.routes:
                 match = path_regex.match(path)
                 if match:
-                    if not methods or method.upper() in map(str.upper, methods):
+                    if not methods or method.upper() in methods:
                         path_params = match.groupdict()
                         processed_path_params = {key: self._convert_value(value) for key, value in path_params.items()}
                         request.path_params = processed_path_params
@@ -537,7 +544,9 @@ class Bermoid:
             if error_code == 404:
                 return exception_dict[404]()
             elif error_code == 405:
-                return exception_dict[405]()
+                allowed_methods = args[1] if len(args) > 1 else None
+                allow = _allow_header(frozenset(allowed_methods)) if allowed_methods else None
+                return exception_dict[405](allow=allow)
             else:
                 return exception_dict[error_code]()
         else:
@@ -106,7 +106,7 @@ class AfterSessionStage:
 
     async def _set_cookie(self, response: Response, session_id: str) -> None:
         signed_session_id = self.serializer.dumps(session_id, settings.SECRET_KEY)
-        await response.set_cookie(
+        response.set_cookie(
             self.cookie_name,
             signed_session_id,
             max_age=self.max_age,
@@ -124,7 +124,7 @@ class AfterSessionStage:
         if session_id and session_id in self.sessions:
             old_session = self.sessions.pop(session_id)
             self.sessions[old_session._session_id] = old_session
-            await response.set_cookie('expired_session', '', max_age=0)
+            response.set_cookie('expired_session', '', max_age=0)
             await self._set_cookie(response, old_session._session_id)
 
     def _get_session_id(self, signed_session_id: Optional[str]) -> Optional[str]:
@@ -82,7 +82,7 @@ class RoutingHelpers:
                     invalid_methods = [method for method in sub_methods if method.upper() not in allowed_methods]
                     raise ImproperlyConfigured(f"Invalid HTTP method(s) provided: {', '.join(invalid_methods)}")
 
-                sub_methods = sub_methods or ["GET"]
+                sub_methods = frozenset(method.upper() for method in sub_methods or ["GET"])
                 
                 converted_path, path_regex = Converter()._regex_converter(path + sub_path, sub_strict_slashes, '')
                 
@@ -153,6 +153,7 @@ class HTTPRouting:
             invalid_methods = [method for method in methods if method.upper() not in allowed_methods]
             if invalid_methods:
                 raise ImproperlyConfigured(f"Invalid HTTP method(s) provided: {', '.join(invalid_methods)}")
+            methods = frozenset(method.upper() for method in methods)
 
             converted_path, path_regex = Converter()._regex_converter(path, strict_slashes, '')
 
@@ -192,6 +193,7 @@ class HTTPRouting:
         invalid_methods = [method for method in methods if method.upper() not in allowed_methods]
         if invalid_methods:
             raise ImproperlyConfigured(f"Invalid HTTP method(s) provided: {', '.join(invalid_methods)}")
+        methods = frozenset(method.upper() for method in methods)
 
         path_regex_compiled = re.compile(path_regex)
 
@@ -244,7 +246,7 @@ class HTTPRouting:
         _routes.append(
             (
                 converted_path,
-                allowed_methods,
+                frozenset(allowed_methods),
                 handler,
                 path_regex,
                 response_model,
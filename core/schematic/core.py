@@ -15,6 +15,7 @@ from typing import (
     Tuple,
     Awaitable,
     Pattern,
+    FrozenSet,
 )
 
 from core.schematic import routing
@@ -56,14 +57,14 @@ class Schematic:
         if "//" in path:
             raise SchematicError("Invalid path: consecutive slashes are not allowed.")
 
-    def _validate_methods(self, methods: Optional[List[str]]) -> List[str]:
+    def _validate_methods(self, methods: Optional[List[str]]) -> FrozenSet[str]:
         allowed = {"GET", "POST", "PUT", "DELETE", "PATCH", "HEAD", "OPTIONS", "TRACE"}
         if not methods:
-            return ["GET"]
+            return frozenset({"GET"})
         for method in methods:
             if method.upper() not in allowed:
                 raise SchematicError(f"Invalid HTTP method: {method}")
-        return [m.upper() for m in methods]
+        return frozenset(m.upper() for m in methods)
 
     def rule(
         self,
@@ -136,9 +137,7 @@ class Schematic:
         self.middlewares.sort(key=lambda x: x["order"])
 
     def _include_registered_routes(self) -> None:
-        for route in routing.routes:
-            path, methods, handler, strict_slashes, response_model, endpoint = route
-            self.routes.append((path, methods, handler, strict_slashes, response_model, endpoint))
+        self.routes.extend(routing.routes)
 
     async def _schematicIdMiddleware(self, request, response):
         response.headers["schematic-instance-id"] = self.schematic_id
@@ -1,5 +1,6 @@
 import inspect
 import re
+from functools import lru_cache, partial
 from typing import (
     Optional,
     List,
@@ -11,98 +12,151 @@ from typing import (
     Pattern,
     Dict,
     Any,
+    FrozenSet,
+    NamedTuple,
+    Union,
 )
 
+from utils.regex import compile_pattern
+
 T = TypeVar("T")
 
-routes: List[
-    Tuple[str, List[str], Callable[..., Awaitable[T]], bool, Optional[Type[T]], Optional[str]]
-] = []
 
-websockets: List[Tuple[str, Callable[..., Awaitable[T]]]] = []
+class Route(NamedTuple):
+    path: Union[str, Pattern[str]]
+    methods: FrozenSet[str]
+    endpoint: Callable[..., Awaitable[Any]]
+    strict_slashes: bool
+    response_model: Optional[Type[Any]]
+    name: Optional[str]
 
 
 class RoutingError(Exception):
     pass
 
 
+_ASYNC_FLAGS = inspect.CO_COROUTINE | inspect.CO_ASYNC_GENERATOR
+
+
 def _ensure_async(fn: Callable[..., Any]) -> None:
-    if not (inspect.iscoroutinefunction(fn) or inspect.isasyncgenfunction(fn)):
+    if isinstance(fn, partial):
+        fn = fn.func
+    code = getattr(fn, "__code__", None)
+    if code is None or not (code.co_flags & _ASYNC_FLAGS):
         raise RoutingError("Registered functions must be asynchronous.")
 
 
+_PATH_OK: Pattern[str] = compile_pattern(r"/(?:[^/]+/)*[^/]*")
+
+
 def _validate_path(path: str) -> None:
-    if not path.startswith("/"):
-        raise RoutingError("Paths must start with '/'.")
-    if "//" in path:
+    if not _PATH_OK.fullmatch(path):
+        if not path.startswith("/"):
+            raise RoutingError("Paths must start with '/'.")
         raise RoutingError("Invalid path: consecutive slashes are not allowed.")
 
 
-def _validate_methods(methods: Optional[List[str]]) -> List[str]:
-    allowed = {"GET", "POST", "PUT", "DELETE", "PATCH", "HEAD", "OPTIONS", "TRACE"}
+_ALLOWED_METHODS: FrozenSet[str] = frozenset(
+    {"GET", "POST", "PUT", "DELETE", "PATCH", "HEAD", "OPTIONS", "TRACE"}
+)
+_DEFAULT_METHODS: FrozenSet[str] = frozenset({"GET"})
+
+
+@lru_cache(maxsize=64)
+def _validate_methods(methods: Optional[Tuple[str, ...]]) -> FrozenSet[str]:
     if not methods:
-        return ["GET"]
+        return _DEFAULT_METHODS
     for m in methods:
-        if m.upper() not in allowed:
+        if m.upper() not in _ALLOWED_METHODS:
             raise RoutingError(f"Invalid HTTP method: {m}")
-    return [m.upper() for m in methods]
+    return frozenset(m.upper() for m in methods)
 
 
-def rule(
-    path: str,
-    endpoint: Callable[..., Awaitable[Any]],
-    methods: Optional[List[str]] = None,
-    response_model: Optional[Type[T]] = None,
-    strict_slashes: bool = True,
-    name: Optional[str] = None,
-) -> Tuple[str, List[str], Callable[..., Awaitable[T]], bool, Optional[Type[T]], Optional[str]]:
-    _validate_path(path)
-    _ensure_async(endpoint)
-    methods = _validate_methods(methods)
-    route = (path, methods, endpoint, strict_slashes, response_model, name)
-    routes.append(route)
-    return route
+def _methods_key(methods: Optional[List[str]]) -> Optional[Tuple[str, ...]]:
+    return tuple(methods) if methods else None
 
 
-def rule_all(
+def _build_route(
     path: str,
     endpoint: Callable[..., Awaitable[Any]],
-    response_model: Optional[Type[T]] = None,
+    methods: FrozenSet[str],
     strict_slashes: bool = True,
+    response_model: Optional[Type[Any]] = None,
     name: Optional[str] = None,
-) -> Tuple[str, List[str], Callable[..., Awaitable[T]], bool, Optional[Type[T]], Optional[str]]:
-    _validate_path(path)
-    _ensure_async(endpoint)
-    methods = ["GET", "POST", "PUT", "DELETE", "PATCH", "HEAD", "OPTIONS", "TRACE"]
-    route = (path, methods, endpoint, strict_slashes, response_model, name)
-    routes.append(route)
-    return route
-
-
-def re_rule(
-    path_regex: str,
-    endpoint: Callable[..., Awaitable[Any]],
-    methods: Optional[List[str]] = None,
-    response_model: Optional[Type[T]] = None,
-    name: Optional[str] = None,
-) -> Tuple[str, List[str], Callable[..., Awaitable[T]], bool, Optional[Type[T]], Optional[str]]:
-    _ensure_async(endpoint)
-    try:
-        pattern = re.compile(path_regex)
-    except re.error:
-        raise RoutingError(f"Invalid regex pattern: {path_regex}")
-    methods = _validate_methods(methods)
-    route = (pattern, methods, endpoint, False, response_model, name)
-    routes.append(route)
-    return route
-
-
-def websocket(
-    path: str,
-    endpoint: Callable[..., Awaitable[T]],
-) -> Tuple[str, Callable[..., Awaitable[T]]]:
+) -> Route:
     _validate_path(path)
     _ensure_async(endpoint)
-    ws = (path, endpoint)
-    websockets.append(ws)
-    return ws
+    return Route(path, methods, endpoint, strict_slashes, response_model, name)
+
+
+class Router:
+    __slots__ = ("routes", "websockets")
+
+    def __init__(self) -> None:
+        self.routes: List[Route] = []
+        self.websockets: Dict[str, Callable[..., Awaitable[Any]]] = {}
+
+    def _register(self, route: Route) -> Route:
+        self.routes.append(route)
+        return route
+
+    def rule(
+        self,
+        path: str,
+        endpoint: Callable[..., Awaitable[Any]],
+        methods: Optional[List[str]] = None,
+        response_model: Optional[Type[T]] = None,
+        strict_slashes: bool = True,
+        name: Optional[str] = None,
+    ) -> Route:
+        methods = _validate_methods(_methods_key(methods))
+        return self._register(_build_route(path, endpoint, methods, strict_slashes, response_model, name))
+
+    def rule_all(
+        self,
+        path: str,
+        endpoint: Callable[..., Awaitable[Any]],
+        response_model: Optional[Type[T]] = None,
+        strict_slashes: bool = True,
+        name: Optional[str] = None,
+    ) -> Route:
+        return self._register(
+            _build_route(path, endpoint, _ALLOWED_METHODS, strict_slashes, response_model, name)
+        )
+
+    def re_rule(
+        self,
+        path_regex: str,
+        endpoint: Callable[..., Awaitable[Any]],
+        methods: Optional[List[str]] = None,
+        response_model: Optional[Type[T]] = None,
+        name: Optional[str] = None,
+    ) -> Route:
+        _ensure_async(endpoint)
+        try:
+            pattern = compile_pattern(path_regex)
+        except re.error:
+            raise RoutingError(f"Invalid regex pattern: {path_regex}")
+        methods = _validate_methods(_methods_key(methods))
+        return self._register(Route(pattern, methods, endpoint, False, response_model, name))
+
+    def websocket(
+        self,
+        path: str,
+        endpoint: Callable[..., Awaitable[T]],
+    ) -> Tuple[str, Callable[..., Awaitable[T]]]:
+        route = _build_route(path, endpoint, frozenset())
+        # First registration wins, as with the old list scan.
+        self.websockets.setdefault(path, route.endpoint)
+        return path, route.endpoint
+
+
+default_router = Router()
+
+routes: List[Route] = default_router.routes
+websockets: Dict[str, Callable[..., Awaitable[Any]]] = default_router.websockets
+
+rule = default_router.rule
+rule_all = default_router.rule_all
+re_rule = default_router.re_rule
+websocket = default_router.websocket
@@ -2,9 +2,14 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass, asdict
-from functools import cached_property
+from functools import cached_property, lru_cache
 from typing import Dict, Optional, Pattern, Tuple
 
+from utils.regex import compile_pattern
+
+
+_VERSION: Pattern = compile_pattern(r"([\d.]+)")
+
 
 @dataclass(frozen=True)
 class UserAgentInfo:
@@ -32,39 +37,45 @@ class UserAgentParser:
         info_dict = parser.to_dict()
     """
 
-    # Precompiled browser patterns ordered by detection priority
-    _BROWSER_PATTERNS: Dict[str, Pattern] = {
-        "Edge": re.compile(r"(?:Edg|Edge)\/(?P<ver>[\d.]+)"),
-        "Chrome": re.compile(r"Chrome\/(?P<ver>[\d.]+)"),
-        "Firefox": re.compile(r"Firefox\/(?P<ver>[\d.]+)"),
-        "Safari": re.compile(r"Version\/(?P<ver>[\d.]+).*Safari"),
-        "Opera": re.compile(r"Opera\/(?P<ver>[\d.]+)|OPR\/(?P<ver2>[\d.]+)"),
-        "IE": re.compile(r"MSIE\s(?P<ver>[\d.]+)|rv:(?P<ver2>[\d.]+)"),
+    # Browser probes ordered by detection priority. Each probe is a literal
+    # located with str.find and a version pattern matched right after it;
+    # when a browser has several literals the leftmost hit wins.
+    _BROWSER_PATTERNS: Dict[str, Tuple[Tuple[str, Pattern], ...]] = {
+        "Edge": (("Edg", compile_pattern(r"e?/([\d.]+)")),),
+        "Chrome": (("Chrome/", _VERSION),),
+        "Firefox": (("Firefox/", _VERSION),),
+        "Safari": (("Version/", compile_pattern(r"([\d.]+).*Safari")),),
+        "Opera": (("Opera/", _VERSION), ("OPR/", _VERSION)),
+        "IE": (("MSIE", compile_pattern(r"\s([\d.]+)")), ("rv:", _VERSION)),
     }
 
-    # Engine keywords (simple contains check is adequate and cheap)
-    _ENGINES = ("Blink", "WebKit", "Gecko", "Trident")
+    # Engine keywords in priority order, followed by the Chrome/Safari
+    # fallbacks; the lowest matching group index wins.
+    _ENGINE_PATTERN: Pattern = compile_pattern(
+        r"(blink)|(webkit)|(gecko)|(trident)|(chrom(?:e|ium))|(safari)"
+    )
+    _ENGINE_NAMES = ("Unknown", "Blink", "WebKit", "Gecko", "Trident", "Blink", "WebKit")
 
     # OS patterns
     _OS_PATTERNS: Dict[str, Pattern] = {
-        "Windows": re.compile(r"Windows NT (?P<ver>[\d.]+)"),
-        "Android": re.compile(r"Android (?P<ver>[\d.]+)"),
-        "iOS": re.compile(r"OS (?P<ver>[\d_]+) like Mac OS X"),
-        "Mac": re.compile(r"Mac OS X (?P<ver>[\d_]+)"),
-        "Linux": re.compile(r"Linux"),
+        "Windows": compile_pattern(r"Windows NT (?P<ver>[\d.]+)"),
+        "Android": compile_pattern(r"Android (?P<ver>[\d.]+)"),
+        "iOS": compile_pattern(r"OS (?P<ver>[\d_]+) like Mac OS X"),
+        "Mac": compile_pattern(r"Mac OS X (?P<ver>[\d_]+)"),
+        "Linux": compile_pattern(r"Linux"),
     }
 
     # Device heuristics
     _DEVICE_PATTERNS: Dict[str, Pattern] = {
-        "iPhone": re.compile(r"iPhone"),
-        "iPad": re.compile(r"iPad"),
-        "Tablet": re.compile(r"Tablet"),
-        "Mobile": re.compile(r"Mobile"),
-        "Desktop": re.compile(r"Windows|Macintosh|X11|Linux"),
+        "iPhone": compile_pattern(r"iPhone"),
+        "iPad": compile_pattern(r"iPad"),
+        "Tablet": compile_pattern(r"Tablet"),
+        "Mobile": compile_pattern(r"Mobile"),
+        "Desktop": compile_pattern(r"Windows|Macintosh|X11|Linux"),
     }
 
     # Bot detector (compiled once)
-    _BOT_PATTERN: Pattern = re.compile(
+    _BOT_PATTERN: Pattern = compile_pattern(
         r"bot|crawler|spider|googlebot|bingbot|slurp|duckduckbot|yandexbot|bingpreview",
         re.IGNORECASE,
     )
@@ -109,35 +120,22 @@ class UserAgentParser:
 
     def _detect_browser(self) -> Tuple[str, str]:
         ua = self._raw
-        for name, pattern in self._BROWSER_PATTERNS.items():
-            m = pattern.search(ua)
-            if not m:
-                continue
-            # prefer named group 'ver', fallback to any group
-            ver = ""
-            if "ver" in m.groupdict() and m.group("ver"):
-                ver = m.group("ver")
-            else:
-                # pick the first non-empty capture group
-                groups = m.groups()
-                for g in groups:
-                    if g:
-                        ver = g
+        for name, probes in self._BROWSER_PATTERNS.items():
+            found = None
+            for literal, version_re in probes:
+                idx = ua.find(literal)
+                while idx != -1 and (found is None or idx < found[0]):
+                    m = version_re.match(ua, idx + len(literal))
+                    if m:
+                        found = (idx, m.group(1))
                         break
-            return name, ver or ""
+                    idx = ua.find(literal, idx + 1)
+            if found is not None:
+                return name, found[1]
         return "Unknown", ""
 
     def _detect_engine(self) -> str:
-        low = self._lower
-        for eng in self._ENGINES:
-            if eng.lower() in low:
-                return eng
-        # heuristics: Chrome implies Blink/WebKit, Safari => WebKit
-        if "chrome" in low or "chromium" in low:
-            return "Blink"
-        if "safari" in low:
-            return "WebKit"
-        return "Unknown"
+        return _engine_for(self._lower)
 
     def _detect_os(self) -> Tuple[str, str]:
         ua = self._raw
@@ -178,3 +176,10 @@ class UserAgentParser:
 
     def __str__(self) -> str:
         return self._raw
+
+
+@lru_cache(maxsize=1024)
+def _engine_for(lowered_ua: str) -> str:
+    """Engine lookup shared by all parsers; a single scan per distinct UA."""
+    found = [m.lastindex for m in UserAgentParser._ENGINE_PATTERN.finditer(lowered_ua)]
+    return UserAgentParser._ENGINE_NAMES[min(found)] if found else "Unknown"
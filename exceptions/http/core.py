@@ -72,10 +72,11 @@ class NotFound(HTTPException):
 
 
 class MethodNotAllowed(HTTPException):
-    def __init__(self, allowed_methods=None, detail=None, headers=None):
-        allowed_methods = allowed_methods or []
+    def __init__(self, allowed_methods=None, detail=None, headers=None, allow=None):
         headers = headers or {}
-        if allowed_methods:
+        if allow is not None:
+            headers["Allow"] = allow
+        elif allowed_methods:
             headers["Allow"] = ", ".join(sorted(set(allowed_methods)))
         detail = detail or "Method Not Allowed"
         super().__init__(405, detail, headers)
@@ -1,26 +1,16 @@
 from __future__ import annotations
 
-def exceptions(error_message: str, formatted_traceback: str, underlined_line: str,
-               error_type: str, file_and_line: str, code_lines: str,
-               system_info: dict, req_data: dict = None):
-
-    def dict_to_html(data: dict) -> str:
-        return "<table class='info-table'>" + "".join(
-            f"<tr><td class='key'>{k}</td><td class='value'>{v}</td></tr>"
-            for k, v in data.items()
-        ) + "</table>"
+import html
+from string import Template
 
-    system_info_content = dict_to_html(system_info)
-    req_info = dict_to_html(req_data) if req_data else "<p>No request data available</p>"
-
-    html_content = f"""
+_PAGE = Template("""
 <html lang="en">
 <head>
 <meta charset="UTF-8">
 <meta name="viewport" content="width=device-width, initial-scale=1.0">
-<title>{error_type}: {error_message}</title>
+<title>${error_type}: ${error_message}</title>
 <style>
-    :root {{
+    :root {
         --font: "Inter", "SF Pro Text", "Segoe UI", Roboto, sans-serif;
         --mono: "JetBrains Mono", "SF Mono", "Consolas", monospace;
 
@@ -33,9 +23,9 @@ def exceptions(error_message: str, formatted_traceback: str, underlined_line: st
         --code-bg: #f8f9fa;
         --error: #d93025;
         --error-bg: #fdecea;
-    }}
-    @media (prefers-color-scheme: dark) {{
-        :root {{
+    }
+    @media (prefers-color-scheme: dark) {
+        :root {
             --bg: #0f0f10;
             --fg: #e4e6eb;
             --muted: #b0b3b8;
@@ -45,10 +35,10 @@ def exceptions(error_message: str, formatted_traceback: str, underlined_line: st
             --code-bg: #18191a;
             --error: #ff6b5a;
             --error-bg: #2d1615;
-        }}
-    }}
+        }
+    }
 
-    body {{
+    body {
         margin: 0;
         background: var(--bg);
         color: var(--fg);
@@ -56,9 +46,9 @@ def exceptions(error_message: str, formatted_traceback: str, underlined_line: st
         display: flex;
         flex-direction: column;
         min-height: 100vh;
-    }}
+    }
 
-    header {{
+    header {
         background: var(--surface);
         border-bottom: 1px solid var(--border);
         padding: 16px 24px;
@@ -66,42 +56,42 @@ def exceptions(error_message: str, formatted_traceback: str, underlined_line: st
         justify-content: space-between;
         align-items: center;
         animation: fadeDown 0.4s ease;
-    }}
+    }
 
-    header h1 {{
+    header h1 {
         font-weight: 600;
         font-size: 18px;
         color: var(--error);
         margin: 0;
-    }}
+    }
 
-    header span {{
+    header span {
         font-size: 13px;
         color: var(--muted);
-    }}
+    }
 
-    main {{
+    main {
         flex: 1;
         padding: 24px;
         animation: fadeIn 0.4s ease;
-    }}
+    }
 
-    footer {{
+    footer {
         border-top: 1px solid var(--border);
         text-align: center;
         color: var(--muted);
         font-size: 13px;
         padding: 12px 0;
-    }}
+    }
 
-    h2 {{
+    h2 {
         font-size: 15px;
         font-weight: 600;
         margin: 24px 0 12px;
         color: var(--fg);
-    }}
+    }
 
-    pre {{
+    pre {
         background: var(--code-bg);
         border: 1px solid var(--border);
         border-radius: 6px;
@@ -112,23 +102,23 @@ def exceptions(error_message: str, formatted_traceback: str, underlined_line: st
         overflow-x: auto;
         line-height: 1.55;
         color: var(--fg);
-    }}
+    }
 
     /* ===== Syntax Highlighting (pure CSS) ===== */
-    pre .kw {{ color: #d73a49; font-weight: 600; }}       /* Keywords */
-    pre .str {{ color: #0b7500; }}                         /* Strings */
-    pre .num {{ color: #1c00cf; }}                         /* Numbers */
-    pre .com {{ color: #6a737d; font-style: italic; }}     /* Comments */
-    pre .errline {{ background: var(--error-bg); border-left: 3px solid var(--error); padding-left: 12px; display: block; }}
+    pre .kw { color: #d73a49; font-weight: 600; }       /* Keywords */
+    pre .str { color: #0b7500; }                         /* Strings */
+    pre .num { color: #1c00cf; }                         /* Numbers */
+    pre .com { color: #6a737d; font-style: italic; }     /* Comments */
+    pre .errline { background: var(--error-bg); border-left: 3px solid var(--error); padding-left: 12px; display: block; }
 
-    details {{
+    details {
         background: var(--surface);
         border: 1px solid var(--border);
         border-radius: 8px;
         margin-bottom: 16px;
         overflow: hidden;
-    }}
-    details summary {{
+    }
+    details summary {
         padding: 12px 16px;
         cursor: pointer;
         font-weight: 500;
@@ -136,76 +126,76 @@ def exceptions(error_message: str, formatted_traceback: str, underlined_line: st
         color: var(--fg);
         list-style: none;
         user-select: none;
-    }}
-    details[open] summary {{
+    }
+    details[open] summary {
         background: var(--code-bg);
         border-bottom: 1px solid var(--border);
         color: var(--accent);
-    }}
-    details > pre, details > div {{
+    }
+    details > pre, details > div {
         padding: 16px;
-    }}
+    }
 
-    .info-table {{
+    .info-table {
         width: 100%;
         border-collapse: collapse;
         font-size: 13px;
-    }}
-    .info-table td {{
+    }
+    .info-table td {
         padding: 6px 8px;
         border-bottom: 1px solid var(--border);
         vertical-align: top;
-    }}
-    .info-table .key {{
+    }
+    .info-table .key {
         color: var(--muted);
         width: 25%;
         font-weight: 500;
-    }}
-
-    @keyframes fadeIn {{
-        from {{opacity: 0; transform: translateY(6px);}}
-        to {{opacity: 1; transform: translateY(0);}}
-    }}
-    @keyframes fadeDown {{
-        from {{opacity: 0; transform: translateY(-6px);}}
-        to {{opacity: 1; transform: translateY(0);}}
-    }}
-    ::selection {{
+    }
+
+    @keyframes fadeIn {
+        from {opacity: 0; transform: translateY(6px);}
+        to {opacity: 1; transform: translateY(0);}
+    }
+    @keyframes fadeDown {
+        from {opacity: 0; transform: translateY(-6px);}
+        to {opacity: 1; transform: translateY(0);}
+    }
+    ::selection {
         background: var(--accent);
         color: #fff;
-    }}
+    }
 </style>
 </head>
 <body>
 <header>
-    <h1>{error_type}</h1>
-    <span>{file_and_line}</span>
+    <h1>${error_type}</h1>
+    <span>${file_and_line}</span>
 </header>
 
 <main>
     <section style="margin-bottom: 24px;">
-        <h2>{error_message}</h2>
-        <pre><span class='errline'>{underlined_line}</span></pre>
+        <h2>${error_message}</h2>
+        <pre><span class='errline'>${underlined_line}</span></pre>
     </section>
 
     <details open>
         <summary>Formatted Traceback</summary>
-        <pre>{formatted_traceback}</pre>
+        <pre>${formatted_traceback}</pre>
     </details>
 
     <details>
         <summary>Detailed Traceback</summary>
-        <pre>{code_lines}</pre>
+        <pre>${code_lines}</pre>
     </details>
 
     <details>
         <summary>Request Information</summary>
-        <div>{req_info}</div>
+        <div>${req_info}</div>
     </details>
 
     <details>
         <summary>System Information</summary>
-        <div>{system_info_content}</div>
+        <div>${system_info_content}</div>
     </details>
 </main>
 
@@ -214,5 +204,33 @@ def exceptions(error_message: str, formatted_traceback: str, underlined_line: st
 </footer>
 </body>
 </html>
-"""
-    return html_content
+""")
+
+
+def _dict_to_html(data: dict) -> str:
+    rows = ["<table class='info-table'>"]
+    append = rows.append
+    esc = html.escape
+    for k, v in data.items():
+        append(f"<tr><td class='key'>{esc(str(k))}</td><td class='value'>{esc(str(v))}</td></tr>")
+    append("</table>")
+    return "".join(rows)
+
+
+def exceptions(error_message: str, formatted_traceback: str, underlined_line: str,
+               error_type: str, file_and_line: str, code_lines: str,
+               system_info: dict, req_data: dict = None):
+
+    system_info_content = _dict_to_html(system_info)
+    req_info = _dict_to_html(req_data) if req_data else "<p>No request data available</p>"
+
+    return _PAGE.substitute(
+        error_type=error_type,
+        error_message=error_message,
+        file_and_line=file_and_line,
+        underlined_line=underlined_line,
+        formatted_traceback=formatted_traceback,
+        code_lines=code_lines,
+        req_info=req_info,
+        system_info_content=system_info_content,
+    )
@@ -17,9 +17,18 @@ class WebSocketException(BermoidBaseException):
         reason = reason or "WebSocket Error"
         self.code = code
         self.reason = reason
+        self._as_dict_cache: typing.Optional[dict[str, typing.Any]] = None
         super().__init__(reason, code=str(code), extra=extra, timestamp=timestamp)
 
     def as_dict(self) -> dict[str, typing.Any]:
-        data = super().as_dict()
-        data.update({"code": self.code, "reason": self.reason})
-        return data
\ No newline at end of file
+        """
+        Serialized form of the exception. The payload is built once and a
+        shallow copy is returned, so callers may freely add keys to it.
+        """
+        data = self._as_dict_cache
+        if data is None:
+            data = super().as_dict()
+            data["code"] = self.code
+            data["reason"] = self.reason
+            self._as_dict_cache = data
+        return data.copy()
\ No newline at end of file
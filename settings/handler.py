@@ -1,21 +1,36 @@
-from typing import Any
+from functools import lru_cache
+from typing import Any, Tuple
 from settings import settings
 from utils.module_loading import import_string
 
 
+@lru_cache(maxsize=512)
+def _cached_import_string(dotted_path: str) -> Any:
+    return import_string(dotted_path)
+
+
 class StageHandler:
     """
     Handles middleware (stage) loading and registration.
     Uses the global 'settings' object instead of dynamically importing settings.py.
     """
 
+    # Normalized STAGE_HANDLERS, rebuilt only when the settings list changes.
+    _plan_source: Any = None
+    _plan: Tuple[Tuple[Any, ...], ...] = ()
+
     def load_middleware_from_path(self, middleware_path: str) -> Any:
         """
         Dynamically load a middleware class or callable from its import path.
         """
         try:
-            middleware = import_string(middleware_path)
+            middleware = _cached_import_string(middleware_path)
+        except Exception as e:
+            raise ImportError(f"Error loading middleware '{middleware_path}': {e}")
+        return self._instantiate(middleware_path, middleware)
 
+    def _instantiate(self, middleware_path: str, middleware: Any) -> Any:
+        try:
             if isinstance(middleware, type):
                 return middleware()  # Instantiate class
             return middleware  # If it’s already a function or instance
@@ -23,16 +38,19 @@ class StageHandler:
         except Exception as e:
             raise ImportError(f"Error loading middleware '{middleware_path}': {e}")
 
-    def process_stage_handlers(self, instance: Any) -> None:
+    def _get_plan(self, stage_handlers: Any) -> Tuple[Tuple[Any, ...], ...]:
         """
-        Processes and registers all middleware defined in settings.STAGE_HANDLERS.
+        Validate STAGE_HANDLERS and resolve every origin once, returning
+        (path, target, stage, order, conditions, group, exclude, inherit)
+        tuples. The result is reused for as long as the settings list is
+        the same object.
         """
-        STAGE_HANDLERS = getattr(settings, "STAGE_HANDLERS", None)
-
-        if not STAGE_HANDLERS:
-            raise AttributeError("STAGE_HANDLERS not found in settings.")
+        cls = type(self)
+        if cls._plan_source is stage_handlers:
+            return cls._plan
 
-        for handler in STAGE_HANDLERS:
+        plan = []
+        for handler in stage_handlers:
             middleware_path = handler.get("origin")
             stage = handler.get("stage")
 
@@ -42,32 +60,63 @@ class StageHandler:
                 raise ValueError(f"Invalid stage '{stage}'. Must be 'before' or 'after'.")
 
             try:
-                middleware_class = self.load_middleware_from_path(middleware_path)
+                target = _cached_import_string(middleware_path)
+            except Exception as e:
+                raise ImportError(
+                    f"Error processing middleware '{middleware_path}': "
+                    f"Error loading middleware '{middleware_path}': {e}"
+                )
+
+            plan.append((
+                middleware_path,
+                target,
+                stage,
+                handler.get("order", 0),
+                handler.get("conditions", None),
+                handler.get("group"),
+                handler.get("exclude"),
+                handler.get("inherit"),
+            ))
+
+        cls._plan_source = stage_handlers
+        cls._plan = tuple(plan)
+        return cls._plan
+
+    def process_stage_handlers(self, instance: Any) -> None:
+        """
+        Processes and registers all middleware defined in settings.STAGE_HANDLERS.
+        """
+        STAGE_HANDLERS = getattr(settings, "STAGE_HANDLERS", None)
+
+        if not STAGE_HANDLERS:
+            raise AttributeError("STAGE_HANDLERS not found in settings.")
+
+        for (
+            middleware_path, target, stage, order, conditions, group, exclude, inherit
+        ) in self._get_plan(STAGE_HANDLERS):
+            try:
+                middleware_class = self._instantiate(middleware_path, target)
 
                 # Register middleware for the stage
                 instance.request_stage_handlers.setdefault(stage, []).append(
-                    (
-                        middleware_class,
-                        handler.get("order", 0),
-                        handler.get("conditions", None),
-                    )
+                    (middleware_class, order, conditions)
                 )
 
                 # Grouped stage (optional)
-                if handler.get("group"):
+                if group:
                     instance.grouped_request_stages \
-                        .setdefault(handler["group"], {}) \
+                        .setdefault(group, {}) \
                         .setdefault(stage, []).append(middleware_class)
 
                 # Excluded stage (optional)
-                if handler.get("exclude"):
+                if exclude:
                     instance.excluded_stages \
-                        .setdefault(handler["exclude"], set()) \
+                        .setdefault(exclude, set()) \
                         .add(middleware_class)
 
                 # Inheritance from group
-                if handler.get("inherit"):
-                    instance._inherit_from_group(stage, handler.get("group"), handler.get("inherit"))
+                if inherit:
+                    instance._inherit_from_group(stage, group, inherit)
 
             except ImportError as e:
                 raise ImportError(f"Error processing middleware '{middleware_path}': {e}")
@@ -1,11 +1,24 @@
-
 # refer @noql -> 5391
 
-from ._templates import (
-    Template as Template,
-    TemplateError as TemplateError,
-    TemplateNotFound as TemplateNotFound,
-    TemplateResponse as TemplateResponse
-)
+# The re-exports are resolved on first access so that importing the
+# package doesn't pull in jinja2.
+from importlib import import_module
+
+_LAZY_EXPORTS = {
+    "Template": "._templates",
+    "TemplateError": "._templates",
+    "TemplateNotFound": "._templates",
+    "TemplateResponse": "._templates",
+    "Jinja2Templates": ".jinja_template",
+}
+
+__all__ = tuple(_LAZY_EXPORTS)
+
 
-from .jinja_template import Jinja2Templates as Jinja2Templates
\ No newline at end of file
+def __getattr__(name: str):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
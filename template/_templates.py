@@ -1,14 +1,11 @@
-import asyncio
-from functools import lru_cache
-from markupsafe import Markup
-from html import escape
+from __future__ import annotations
 
-try:
-    from jinja2 import Environment, FileSystemLoader, select_autoescape, Template, TemplateNotFound, TemplateError
-except ImportError:
-    Environment, FileSystemLoader, select_autoescape, Template, TemplateNotFound, TemplateError = None, None, None, None, None, None
+import hashlib
+from collections import OrderedDict
+from importlib.util import find_spec
 
 from typing import (
+    TYPE_CHECKING,
     Any,
     Dict,
     Optional,
@@ -22,7 +19,43 @@ from settings import settings
 from exceptions.http.handler import handle_exception
 from exceptions.config import ImproperlyConfigured
 
+# jinja2 and markupsafe are imported inside the methods that need them, so
+# importing this module (or the ``template`` package) doesn't load them.
+if TYPE_CHECKING:
+    from jinja2 import Environment, Template
+
+_JINJA_EXPORTS = ("Template", "TemplateNotFound", "TemplateError")
+
+
+_PRELOAD_SUFFIXES = (".html", ".xml", ".jinja")
+
+
 class TemplateResponse:
+    __slots__ = (
+        "template_paths",
+        "default_context",
+        "autoescape",
+        "template_engine",
+        "cache_size",
+        "context_processors",
+        "flash_config",
+        "custom_filters",
+        "custom_globals",
+        "enable_template_cache",
+        "custom_extensions",
+        "preload",
+        "csrf",
+        "env",
+        "_processor_pairs",
+        "_tpl_cache",
+        "_csrf_tag_prefix",
+        "_csrf_tag_suffix",
+        "_csrf_empty",
+        "cached_templates",
+        "render_cache_size",
+        "_render_cache",
+    )
+
     def __init__(
         self
     ):
@@ -50,29 +83,47 @@ class TemplateResponse:
         self.template_engine = backend.lower()
         self.cache_size = options.get("cache_size", 400)
         self.context_processors = options.get("context_processors", [])
+        self._processor_pairs = [(self._get_processor_name(p), p) for p in self.context_processors]
         self.flash_config = {'with_category': False, 'category_filter': ()}
         self.custom_filters = options.get("filters", {})
         self.custom_globals = options.get("globals", {})
         self.enable_template_cache = options.get("enable_template_cache", True)
         self.custom_extensions = options.get("extensions", [])
+        self.preload = options.get("preload", True)
+        self.cached_templates = frozenset(options.get("render_cache", ()))
+        self.render_cache_size = options.get("render_cache_size", 1000)
+        self._render_cache: OrderedDict[tuple[str, bytes], str] = OrderedDict()
         self.csrf = csrf
+        self._tpl_cache: Dict[str, Template] = {}
+        if csrf is not None:
+            from markupsafe import Markup
+
+            self._csrf_empty = Markup('')
+            self._csrf_tag_prefix = Markup(f'<input name="{csrf.csrf_token_key}" type="hidden" value="')
+            self._csrf_tag_suffix = Markup('"></input>')
 
         if self.template_engine not in ["jinja2"]:
             raise ValueError("Unsupported template engine. Currently, only 'jinja2' is supported.")
 
         self.env: Environment = self._create_environment()
 
+        if self.preload:
+            self._preload_templates()
+
     def _check_jinja2_library(self):
-        if Environment is None:
+        if find_spec("jinja2") is None:
             raise ImportError("Jinja2 library is not installed. Please install it using 'pip install jinja2' or 'pip install aquilify[jinja2]'.")
 
     def _create_environment(self) -> Environment:
         if self.template_engine == "jinja2":
+            from jinja2 import Environment, FileSystemLoader, select_autoescape
+
             loader = FileSystemLoader(self.template_paths)
             environment = Environment(
                 loader=loader,
                 autoescape=select_autoescape(['html', 'xml']) if self.autoescape else False,
                 cache_size=self.cache_size if self.enable_template_cache else 0,
+                enable_async=True,
      
                 extensions=self.custom_extensions,
             )
@@ -80,10 +131,27 @@ class TemplateResponse:
             environment.globals.update(self.custom_globals)
             return environment
 
-    @lru_cache(maxsize=None)
+    def _preload_templates(self) -> None:
+        # Compile every template up front so the first request for each one
+        # doesn't pay Jinja's parse/compile cost. Anything that fails here
+        # (syntax errors, undecodable or unreadable files) is skipped and left
+        # for _get_template to report when it is actually requested.
+        names = self.env.list_templates(filter_func=lambda name: name.endswith(_PRELOAD_SUFFIXES))
+        for name in names:
+            try:
+                self._tpl_cache[name] = self.env.get_template(name)
+            except Exception:
+                continue
+
     def _get_template(self, template_name: str) -> Template:
+        template = self._tpl_cache.get(template_name)
+        if template is not None:
+            return template
+        from jinja2 import TemplateNotFound, TemplateError
+
         try:
-            return self.env.get_template(template_name)
+            template = self._tpl_cache[template_name] = self.env.get_template(template_name)
+            return template
         except TemplateNotFound as e:
             error_message = f"Template not found: {e.name}"
             raise FileNotFoundError(error_message) from e
@@ -91,17 +159,19 @@ class TemplateResponse:
             error_message = f"Error loading template '{template_name}': {str(e)}"
             raise FileNotFoundError(error_message) from e
 
-    def _inject_default_context(self, context: Dict[str, Any]) -> Dict[str, Any]:
-        injected_context = self.default_context.copy()
-        injected_context.update(context)
-        return injected_context
-
-    async def _add_url_generation(self, request: Request, context: Dict[str, Any], csrf_protect) -> Dict[str, Any]:
+    async def _build_context(self, request: Request, user_ctx: Dict[str, Any], csrf_protect) -> Dict[str, Any]:
+        # Default context, flashes, CSRF helper and context processors are
+        # applied to a single dict instead of one copy per step.
+        context = dict(self.default_context) if self.default_context else {}
+        context.update(user_ctx)
+        context['flashes'] = await self._get_flashes(request) if 'flash' in request.context else {}
         if self.csrf is not None:
-            context['flashes'] = await self._get_flashes(request)
             context['csrf_protect'] = csrf_protect
-            return context
-        context['flashes'] = await self._get_flashes(request)
+        for processor_name, processor in self._processor_pairs:
+            processed_context = processor(context, request)
+            if not isinstance(processed_context, dict):
+                raise ValueError(f"{processor_name} must return a dictionary.")
+            context = processed_context
         return context
 
     def _get_processor_name(self, processor) -> str:
@@ -113,16 +183,18 @@ class TemplateResponse:
         else:
             return f"Function '{processor.__name__}'"
 
-    def _run_context_processors(self, context: Dict[str, Any], request: Request) -> Dict[str, Any]:
-        for processor in self.context_processors:
-            processor_name = self._get_processor_name(processor)
+    def _render_cache_key(self, template_name: str, inherit: Optional[str], context: Dict[str, Any]) -> tuple[str, bytes]:
+        if self.default_context:
+            context = {**self.default_context, **context}
+        digest = hashlib.blake2b(repr((inherit, sorted(context.items()))).encode(), digest_size=16).digest()
+        return template_name, digest
+
+    def _store_rendered(self, key: tuple[str, bytes], content: str) -> None:
+        cache = self._render_cache
+        cache[key] = content
+        if len(cache) > self.render_cache_size:
+            cache.popitem(last=False)
 
-            processed_context = processor(context, request)
-            if not isinstance(processed_context, dict):
-                raise ValueError(f"{processor_name} must return a dictionary.")
-            context = processed_context
-        return context
-    
     async def _clear_flashes(self, request: Request):
         request.context['flash'] = {}
 
@@ -131,14 +203,16 @@ class TemplateResponse:
         context.setdefault(category, []).append(message)
 
     async def _get_flashes(self, request: Request) -> Dict[str, List[str]]:
-        with_category = self.flash_config.get('with_category', False)
-        category_filter = self.flash_config.get('category_filter', ())
+        request_context = request.context
+        if 'flash' not in request_context:
+            return {}
 
-        flashes = request.context.pop('flash', {})
+        flashes = request_context.pop('flash')
 
-        if not with_category:
+        if not self.flash_config.get('with_category', False):
             return flashes
 
+        category_filter = self.flash_config.get('category_filter', ())
         if category_filter:
             filtered_flashes = {category: messages for category, messages in flashes.items() if category in category_filter}
             return filtered_flashes
@@ -157,30 +231,59 @@ class TemplateResponse:
         
         if context is None:
             context = {}
-        
+
+        # Opt-in output cache for templates listed in OPTIONS['render_cache'].
+        # Pages carrying a CSRF token or pending flashes are never cached, and
+        # neither is anything when context processors (which see the request)
+        # are configured, since their output isn't part of the key.
+        cache_key = None
+        if (
+            template_name in self.cached_templates
+            and self.csrf is None
+            and not self._processor_pairs
+            and 'flash' not in request.context
+        ):
+            cache_key = self._render_cache_key(template_name, inherit, context)
+            # X-Cache is added below; don't write it into the caller's dict.
+            headers = dict(headers or {})
+            cached = self._render_cache.get(cache_key)
+            if cached is not None:
+                self._render_cache.move_to_end(cache_key)
+                response = Response(cached, content_type='text/html', status_code=status_code, headers=headers)
+                response.headers['X-Cache'] = 'HIT'
+                return response
+
         token = None
         if self.csrf is not None:
             token = await self.csrf.generate_csrf_token(request.remote_addr)
-            token_name = self.csrf.csrf_token_key
-            csrf_protect = lambda: Markup(f'<input name="{token_name}" type="hidden" value="{escape(token)}"></input>') if token else ''
+            # Adding a plain str to Markup escapes it.
+            csrf_protect = lambda: (
+                self._csrf_tag_prefix + token + self._csrf_tag_suffix if token else self._csrf_empty
+            )
 
-        csrf_protect = None
+        else:
+            csrf_protect = None
         
-        template = await asyncio.to_thread(self._get_template, template_name)
-        context = self._inject_default_context(context)
-        context = await self._add_url_generation(request, context, csrf_protect)
-        context = self._run_context_processors(context, request)
+        template = self._get_template(template_name)
+        context = await self._build_context(request, context, csrf_protect)
 
         try:
             if inherit:
-                inherited_template = await asyncio.to_thread(self._get_template, inherit)
-                content = await asyncio.to_thread(template.render, content=inherited_template.render(**context), **context)
+                inherited_template = self._get_template(inherit)
+                content = await template.render_async(
+                    content=await inherited_template.render_async(**context), **context
+                )
             else:
-                content = await asyncio.to_thread(template.render, **context)
-        except TemplateNotFound as e:
-            error_message = f"Template not found: {e.name}"
-            raise FileNotFoundError(error_message) from e
-        except TemplateError as e:
+                content = await template.render_async(**context)
+        except Exception as e:
+            # Resolved only on failure to keep the import off the render path.
+            from jinja2 import TemplateNotFound, TemplateError
+
+            if isinstance(e, TemplateNotFound):
+                error_message = f"Template not found: {e.name}"
+                raise FileNotFoundError(error_message) from e
+            if not isinstance(e, TemplateError):
+                raise
             await handle_exception(e)
 
         response = Response(
@@ -192,6 +295,9 @@ class TemplateResponse:
         if self.csrf is not None:
             await self.csrf.inject_csrf_token(response, token)
             response.headers['X-CSRF-TOKEN'] = token
+        if cache_key is not None:
+            self._store_rendered(cache_key, content)
+            response.headers['X-Cache'] = 'MISS'
         return response
 
     async def __call__(
@@ -203,43 +309,17 @@ class TemplateResponse:
         headers: Dict[str, str] = None,
         inherit: Optional[str] = None,
     ) -> Response:
-        
-        if context is None:
-            context = {}
-        
-        token = None
-        if self.csrf is not None:
-            token = await self.csrf.generate_csrf_token(request.remote_addr)
-            token_name = self.csrf.csrf_token_key
-            csrf_protect = lambda: Markup(f'<input name="{token_name}" type="hidden" value="{escape(token)}"></input>') if token else ''
+        return await self.render(request, template_name, context, status_code, headers, inherit)
 
-        else:
-            csrf_protect = None
-        
-        template = await asyncio.to_thread(self._get_template, template_name)
-        context = self._inject_default_context(context)
-        context = await self._add_url_generation(request, context, csrf_protect)
-        context = self._run_context_processors(context, request)
 
-        try:
-            if inherit:
-                inherited_template = await asyncio.to_thread(self._get_template, inherit)
-                content = await asyncio.to_thread(template.render, content=inherited_template.render(**context), **context)
-            else:
-                content = await asyncio.to_thread(template.render, **context)
-        except TemplateNotFound as e:
-            error_message = f"Template not found: {e.name}"
-            raise FileNotFoundError(error_message) from e
-        except TemplateError as e:
-            await handle_exception(e)
 
-        response = Response(
-            content,
-            content_type='text/html',
-            status_code=status_code,
-            headers=headers
-        )
-        if self.csrf is not None:
-            await self.csrf.inject_csrf_token(response, token)
-            response.headers['X-CSRF-TOKEN'] = token
-        return response
\ No newline at end of file
+def __getattr__(name: str):
+    # Kept for ``from template._templates import Template`` style imports;
+    # ``None`` when jinja2 is missing, as before.
+    if name in _JINJA_EXPORTS:
+        try:
+            import jinja2
+        except ImportError:
+            return None
+        return getattr(jinja2, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
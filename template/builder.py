@@ -15,6 +15,9 @@ class AvailableTemplates(Enum):
     XENARX = "template.xenarx.XenarxTemplate"
     JINJA2 = "template.jinja2.Jinja2Template"
 
+# Resolved backend classes keyed by their BACKEND import path.
+_BACKEND_CACHE: Dict[str, Type] = {}
+
 class TemplateBuilder:
     @staticmethod
     def get_template_backend() -> str:
@@ -40,8 +43,11 @@ class TemplateBuilder:
     @staticmethod
     def build_template() -> Type:
         backend = TemplateBuilder.get_template_backend()
-        TemplateBuilder.validate_template_backend(backend)
-        return TemplateBuilder.import_template_module(backend)
+        template_cls = _BACKEND_CACHE.get(backend)
+        if template_cls is None:
+            TemplateBuilder.validate_template_backend(backend)
+            template_cls = _BACKEND_CACHE[backend] = TemplateBuilder.import_template_module(backend)
+        return template_cls
 
 class TemplateFactory:
     @staticmethod
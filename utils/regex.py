@@ -0,0 +1,27 @@
+import re
+from typing import Pattern
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+# Flags google-re2 understands when spelled as an inline group.
+_INLINE_FLAGS = {re.IGNORECASE: "i", re.MULTILINE: "m", re.DOTALL: "s"}
+
+
+def compile_pattern(pattern: str, flags: int = 0) -> Pattern:
+    """
+    Compile ``pattern`` with google-re2 (linear-time matching) when it is
+    installed, otherwise with the stdlib ``re`` module. Patterns or flags
+    that re2 does not support (backreferences, lookaround, VERBOSE, ...)
+    transparently fall back to ``re``.
+    """
+    if re2 is not None:
+        inline = "".join(char for flag, char in _INLINE_FLAGS.items() if flags & flag)
+        if flags & ~(re.IGNORECASE | re.MULTILINE | re.DOTALL | re.UNICODE) == 0:
+            try:
+                return re2.compile(f"(?{inline}){pattern}" if inline else pattern)
+            except re2.error:
+                pass
+    return re.compile(pattern, flags)
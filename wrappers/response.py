@@ -3,13 +3,105 @@ from __future__ import annotations
 import json
 import secrets
 import gzip
-import io
-from typing import Optional, List, Union, Callable, Any, Dict
-from datetime import datetime, timedelta
+import time
+import zlib
+from functools import lru_cache, wraps
+from typing import Optional, List, Union, Callable, Any, Dict, Tuple
+from datetime import datetime
 
 from wrappers.http_status import HTTP_STATUS_PHRASE
 from exceptions.http import HTTPException  
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_dumps(obj: Any) -> bytes:
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+if orjson is not None:
+    def _dumps(obj: Any) -> bytes:
+        # orjson is stricter than json (e.g. ints beyond 64 bits), so
+        # anything it refuses is handed to the stdlib encoder.
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            return _json_dumps(obj)
+else:
+    _dumps = _json_dumps
+
+
+_WKDAY = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+_MONTH = ("", "Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+_EPOCH_GMT = "Thu, 01 Jan 1970 00:00:00 GMT"
+
+
+def _format_gmt(tt: time.struct_time) -> str:
+    """Format a UTC time tuple as an HTTP date without going through strftime."""
+    return "%s, %02d %s %04d %02d:%02d:%02d GMT" % (
+        _WKDAY[tt.tm_wday], tt.tm_mday, _MONTH[tt.tm_mon], tt.tm_year, tt.tm_hour, tt.tm_min, tt.tm_sec
+    )
+
+
+# Bodies below this size grow under gzip's fixed framing overhead, and these
+# types are already compressed; both are sent as-is even with compress=True.
+_MIN_COMPRESS_SIZE = 500
+_NO_COMPRESS_TYPES = frozenset({
+    "image/jpeg",
+    "image/png",
+    "image/gif",
+    "image/webp",
+    "video/mp4",
+    "application/zip",
+    "application/gzip",
+    "application/x-brotli",
+})
+
+
+# Attributes of the common session-style cookie, appended verbatim by the
+# set_cookie fast path.
+_COOKIE_FAST_SUFFIX = "; Path=/; HttpOnly; SameSite=Lax"
+
+
+def _preserialize(content: Any) -> Any:
+    """Return dict/list JSON content as bytes, or unchanged if it can't be encoded yet."""
+    if isinstance(content, (dict, list)):
+        try:
+            return _dumps(content)
+        except (TypeError, ValueError):
+            # Left for the send path to fail on, inside __call__'s 500 handling.
+            pass
+    return content
+
+
+@lru_cache(maxsize=64)
+def _content_type_header(content_type: str, encoding: str) -> bytes:
+    return f"{content_type}; charset={encoding}".encode()
+
+
+@lru_cache(maxsize=256)
+def _encode_header_name(name: Union[str, bytes]) -> bytes:
+    """Encode a header name for ASGI, lowercased."""
+    if isinstance(name, str):
+        name = name.encode()
+    return name.lower()
+
+
+def _translate_errors(fn):
+    """Surface any non-HTTP error raised while sending a response as a 500."""
+    @wraps(fn)
+    async def wrapper(*args, **kwargs):
+        try:
+            return await fn(*args, **kwargs)
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e)) from e
+    return wrapper
+
 
 class HTTPStatus:
     def __init__(self, code: int, phrase: str):
@@ -28,142 +120,175 @@ class Response:
         headers: Optional[Dict[str, str]] = None,
         content_type: str = "text/plain",
         compress: bool = False,
+        compress_level: int = 6,
+        min_flush_size: int = 0,
     ):
+        if content_type == "application/json":
+            # Serialize once here so a reused JSON response (health checks,
+            # static payloads) is sent as plain bytes on every call.
+            content = _preserialize(content)
         self.status_code = status_code
         self.headers = headers or {}
         self.content_type = content_type
         self.content = content
         self.streaming = callable(content)
         self.compress = compress
+        self.compress_level = compress_level
+        self.min_flush_size = min_flush_size
         self.encoding = "utf-8"
+        self._cookie_headers: List[Tuple[bytes, bytes]] = []
+        self._stream_chunks: Optional[List[bytes]] = None
 
+    @_translate_errors
     async def __call__(self, scope, receive, send):
-        try:
-            response_headers = {
-                b"Content-Type": f"{self.content_type}; charset={self.encoding}".encode(),
-                **{
-                    (k.encode() if isinstance(k, str) else k): (
-                        v.encode() if isinstance(v, str) else v
-                    )
-                    for k, v in self.headers.items()
-                },
+        # One lookup on the public attributes, so changes made to streaming
+        # or compress after construction are still honoured.
+        await self._RUNNERS[self.streaming, bool(self.compress)](self, scope, receive, send)
+
+    def _start_headers(self) -> Dict[bytes, bytes]:
+        response_headers = {
+            b"content-type": _content_type_header(self.content_type, self.encoding),
+        }
+        for key, value in self.headers.items():
+            # Values are often per-response (tokens, ETags), so only the
+            # names go through the cache.
+            if isinstance(value, str):
+                value = value.encode()
+            elif not isinstance(value, bytes):
+                value = str(value).encode()
+            response_headers[_encode_header_name(key)] = value
+        return response_headers
+
+    async def _send_start(self, send, response_headers: Dict[bytes, bytes]) -> None:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self.status_code,
+                "headers": [*response_headers.items(), *self._cookie_headers],
             }
+        )
 
-            content_length = 0
-            if self.content:
-                if isinstance(self.content, str):
-                    content_length = len(self.content.encode(self.encoding))
-                elif isinstance(self.content, bytes):
-                    content_length = len(self.content)
-                elif callable(self.content):
-                    content_length = await self.get_stream_content_length(scope, receive, send)
-
-            response_headers[b"Content-Length"] = str(content_length).encode()
-
-            await send(
-                {
-                    "type": "http.response.start",
-                    "status": self.status_code,
-                    "headers": list(response_headers.items()),
-                }
-            )
-
-            if self.compress:
-                if self.streaming:
-                    await self._send_streaming_response_compressed(scope, receive, send)
-                else:
-                    await self._send_standard_response_compressed(send)
-            else:
-                if self.streaming:
-                    await self._send_streaming_response(scope, receive, send)
-                else:
-                    await self._send_standard_response(send)
+    async def _run_standard_plain(self, scope, receive, send):
+        response_headers = self._start_headers()
+        body = self._materialize_body()
+        response_headers[b"content-length"] = str(len(body)).encode()
+        await self._send_start(send, response_headers)
+        await send({"type": "http.response.body", "body": body})
 
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=str(e))
+    async def _run_standard_gzip(self, scope, receive, send):
+        response_headers = self._start_headers()
+        body = self._materialize_body()
+        if len(body) >= _MIN_COMPRESS_SIZE and self.content_type not in _NO_COMPRESS_TYPES:
+            body = gzip.compress(body, compresslevel=self.compress_level, mtime=0)
+            response_headers[b"content-encoding"] = b"gzip"
+        response_headers[b"content-length"] = str(len(body)).encode()
+        await self._send_start(send, response_headers)
+        await send({"type": "http.response.body", "body": body})
+
+    # Streaming bodies go out without a Content-Length so the server frames
+    # them (chunked); measuring them would consume the stream.
+    async def _run_stream_plain(self, scope, receive, send):
+        await self._send_start(send, self._start_headers())
+        await self._send_streaming_response(scope, receive, send)
+
+    async def _run_stream_gzip(self, scope, receive, send):
+        response_headers = self._start_headers()
+        if self.content_type in _NO_COMPRESS_TYPES:
+            await self._send_start(send, response_headers)
+            await self._send_streaming_response(scope, receive, send)
+            return
+        response_headers[b"content-encoding"] = b"gzip"
+        await self._send_start(send, response_headers)
+        await self._send_streaming_response_compressed(scope, receive, send)
+
+    _RUNNERS = {
+        (False, False): _run_standard_plain,
+        (False, True): _run_standard_gzip,
+        (True, False): _run_stream_plain,
+        (True, True): _run_stream_gzip,
+    }
 
     async def _send_streaming_response_compressed(self, scope, receive, send):
-        try:
-            if callable(self.content):
-                gzip_buffer = io.BytesIO()
-                gzip_stream = gzip.GzipFile(fileobj=gzip_buffer, mode="w")
-
-                async for chunk in self.content(scope, receive, send):
-                    gzip_stream.write(chunk)
-                    gzip_stream.flush()
-                    await send(
-                        {
-                            "type": "http.response.body",
-                            "body": gzip_buffer.getvalue(),
-                            "more_body": True,
-                        }
-                    )
-                    gzip_buffer.truncate(0)
-                    gzip_buffer.seek(0)
-
-                gzip_stream.close()
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Gzip stream error: {e}")
+        if self.content is not None:
+            # wbits=31 makes zlib emit a gzip container; one compressor
+            # carries state across chunks instead of a GzipFile/BytesIO pair.
+            # Output is gathered in a bytearray and sync-flushed once
+            # min_flush_size input bytes are pending; with the default of 0
+            # that is after every chunk, so streamed output isn't held back.
+            compressor = zlib.compressobj(self.compress_level, zlib.DEFLATED, 31)
+            buf = bytearray()
+            pending = 0
+            min_flush_size = self.min_flush_size
 
-    async def _send_standard_response_compressed(self, send):
-        try:
-            if self.content is not None:
-                body = (
-                    self.content.encode(self.encoding)
-                    if isinstance(self.content, str)
-                    else self.content
-                    if isinstance(self.content, bytes)
-                    else json.dumps(self.content).encode(self.encoding)
-                )
-                await send(
-                    {
-                        "type": "http.response.body",
-                        "body": gzip.compress(body),
-                    }
-                )
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Compression failed: {e}")
+            async for chunk in self._open_stream(scope, receive, send):
+                if isinstance(chunk, str):
+                    chunk = chunk.encode(self.encoding)
+                buf += compressor.compress(chunk)
+                pending += len(chunk)
+                if pending >= min_flush_size:
+                    buf += compressor.flush(zlib.Z_SYNC_FLUSH)
+                    await send({"type": "http.response.body", "body": bytes(buf), "more_body": True})
+                    buf.clear()
+                    pending = 0
+
+            buf += compressor.flush(zlib.Z_FINISH)
+            await send({"type": "http.response.body", "body": bytes(buf), "more_body": False})
+
+    def _materialize_body(self) -> bytes:
+        content = self.content
+        if content is None:
+            return b""
+        if isinstance(content, bytes):
+            return content
+        if isinstance(content, str):
+            return content.encode(self.encoding)
+        return _dumps(content)
 
     async def _send_streaming_response(self, scope, receive, send):
-        try:
-            if self.content:
-                async for chunk in self.content(scope, receive, send):
-                    await send(
-                        {
-                            "type": "http.response.body",
-                            "body": chunk.encode(self.encoding)
-                            if isinstance(chunk, str)
-                            else chunk,
-                            "more_body": True,
-                        }
-                    )
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Streaming failed: {e}")
+        if self.content is not None:
+            min_flush_size = self.min_flush_size
+            if min_flush_size <= 0:
+                # Default: every chunk goes out as soon as it is produced
+                # (SSE, progress output and long-polls rely on this).
+                encoding = self.encoding
+                async for chunk in self._open_stream(scope, receive, send):
+                    if isinstance(chunk, str):
+                        chunk = chunk.encode(encoding)
+                    await send({"type": "http.response.body", "body": chunk, "more_body": True})
+                await send({"type": "http.response.body", "body": b"", "more_body": False})
+                return
 
-    async def _send_standard_response(self, send):
-        try:
-            if self.content is not None:
-                body = (
-                    self.content.encode(self.encoding)
-                    if isinstance(self.content, str)
-                    else self.content
-                    if isinstance(self.content, bytes)
-                    else json.dumps(self.content).encode(self.encoding)
-                )
-                await send({"type": "http.response.body", "body": body})
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Response send error: {e}")
+            # Opt-in: small chunks are coalesced so each send carries at
+            # least min_flush_size bytes, cutting per-send (syscall) overhead.
+            buf = bytearray()
+            async for chunk in self._open_stream(scope, receive, send):
+                buf += chunk.encode(self.encoding) if isinstance(chunk, str) else chunk
+                if len(buf) >= min_flush_size:
+                    await send({"type": "http.response.body", "body": bytes(buf), "more_body": True})
+                    buf.clear()
+
+            await send({"type": "http.response.body", "body": bytes(buf), "more_body": False})
+
+    async def _replay_stream(self):
+        for chunk in self._stream_chunks:
+            yield chunk
+
+    def _open_stream(self, scope, receive, send):
+        if self._stream_chunks is not None:
+            return self._replay_stream()
+        return self.content(scope, receive, send)
 
     async def get_stream_content_length(self, scope, receive, send) -> int:
-        try:
-            total = 0
-            async for chunk in self.content(scope, receive, send):
-                total += len(chunk.encode(self.encoding)) if isinstance(chunk, str) else len(chunk)
-            return total
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Content length calc error: {e}")
+        # The stream can only be consumed once, so the encoded chunks are
+        # kept and replayed by the send path instead of being lost.
+        encoding = self.encoding
+        chunks = self._stream_chunks = [
+            chunk.encode(encoding) if isinstance(chunk, str) else chunk
+            async for chunk in self.content(scope, receive, send)
+        ]
+        return sum(map(len, chunks))
 
-    async def set_cookie(
+    def set_cookie(
         self,
         key: str,
         value: str,
@@ -175,66 +300,56 @@ class Response:
         httponly: bool = False,
         samesite: Optional[str] = None,
     ):
-        try:
-            cookie_parts = [f"{key}={value}"]
-            if max_age:
-                cookie_parts.append(f"Max-Age={max_age}")
-            if expires:
-                if isinstance(expires, int):
-                    expires = datetime.now() + timedelta(seconds=expires)
-                cookie_parts.append(f"Expires={expires.strftime('%a, %d %b %Y %H:%M:%S GMT')}")
-            if path:
-                cookie_parts.append(f"Path={path}")
-            if domain:
-                cookie_parts.append(f"Domain={domain}")
-            if secure:
-                cookie_parts.append("Secure")
-            if httponly:
-                cookie_parts.append("HttpOnly")
-            if samesite:
-                cookie_parts.append(f"SameSite={samesite}")
-
-            self.headers["Set-Cookie"] = "; ".join(cookie_parts)
-        except Exception as e:
-            raise HTTPException(status_code=400, detail=f"Cookie set failed: {e}")
+        if (
+            httponly and path == "/" and samesite == "Lax"
+            and max_age is None and expires is None and not (domain or secure)
+        ):
+            cookie = f"{key}={value}{_COOKIE_FAST_SUFFIX}"
+            self._cookie_headers.append((b"set-cookie", cookie.encode()))
+            return
 
-    async def delete_cookie(self, key: str):
-        try:
-            expires = datetime(1970, 1, 1).strftime("%a, %d %b %Y %H:%M:%S GMT")
-            self.headers["Set-Cookie"] = f"{key}=; Expires={expires}; Max-Age=0; Path=/"
-        except Exception as e:
-            raise HTTPException(status_code=400, detail=f"Cookie delete failed: {e}")
+        cookie_parts = [f"{key}={value}"]
+        if max_age is not None:
+            cookie_parts.append(f"Max-Age={max_age}")
+        if expires is not None:
+            if isinstance(expires, int):
+                expires = _format_gmt(time.gmtime(time.time() + expires))
+            else:
+                expires = _format_gmt(expires.utctimetuple())
+            cookie_parts.append(f"Expires={expires}")
+        if path:
+            cookie_parts.append(f"Path={path}")
+        if domain:
+            cookie_parts.append(f"Domain={domain}")
+        if secure:
+            cookie_parts.append("Secure")
+        if httponly:
+            cookie_parts.append("HttpOnly")
+        if samesite:
+            cookie_parts.append(f"SameSite={samesite}")
 
-    async def json(self, content: Any, status_code: int = 200):
-        try:
-            self.content_type = "application/json"
-            self.status_code = status_code
-            self.content = content
-            self.streaming = False
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"JSON response failed: {e}")
+        self._cookie_headers.append((b"set-cookie", "; ".join(cookie_parts).encode()))
 
-    async def stream(self, content: Union[str, bytes, Callable] = None):
-        try:
-            self.streaming = True
-            if content:
-                self.content = content
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Stream setup failed: {e}")
+    def delete_cookie(self, key: str):
+        self._cookie_headers.append((b"set-cookie", f"{key}=; Expires={_EPOCH_GMT}; Max-Age=0; Path=/".encode()))
+
+    def json(self, content: Any, status_code: int = 200):
+        self.content_type = "application/json"
+        self.status_code = status_code
+        self.content = _preserialize(content)
+        self.streaming = False
+
+    def stream(self, content: Union[str, bytes, Callable] = None):
+        self.streaming = True
+        if content is not None:
+            self.content = content
+            self._stream_chunks = None
 
     @property
     def status_text(self):
         return f"{self.status_code} {HTTP_STATUS_PHRASE(self.status_code, 'Unknown')}"
 
-    async def calculate_content_length(self):
-        try:
-            if self.content is None:
-                return 0
-            if isinstance(self.content, str):
-                return len(self.content.encode(self.encoding))
-            elif isinstance(self.content, bytes):
-                return len(self.content)
-            else:
-                return len(json.dumps(self.content).encode(self.encoding))
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Content length calc failed: {e}")
+    def calculate_content_length(self):
+        # Computed from the current content each time; nothing is memoized,
+        # so reassigning ``content`` is always reflected.
+        return len(self._materialize_body())